@@ -1,77 +1,80 @@
 """Platform config client."""
 
+from importlib import import_module
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
-from .client import ConfigClient, ConfigClientBase
-from .entities import (
-    ACMEEnvironment,
-    AddNodePoolRequest,
-    ARecord,
-    AWSCloudProvider,
-    AWSCredentials,
-    AWSStorage,
-    AzureCloudProvider,
-    AzureCredentials,
-    AzureReplicationType,
-    AzureStorage,
-    AzureStorageTier,
-    BucketsConfig,
-    CloudProvider,
-    CloudProviderOptions,
-    CloudProviderType,
-    Cluster,
-    ClusterLocationType,
-    ClusterStatus,
-    CredentialsConfig,
-    DisksConfig,
-    DNSConfig,
-    DockerRegistryConfig,
-    EFSPerformanceMode,
-    EFSThroughputMode,
-    EMCECSCredentials,
-    EnergyConfig,
-    EnergySchedule,
-    EnergySchedulePeriod,
-    GoogleCloudProvider,
-    GoogleFilestoreTier,
-    GoogleStorage,
-    GrafanaCredentials,
-    HelmRegistryConfig,
-    IdleJobConfig,
-    IngressConfig,
-    MetricsConfig,
-    MinioCredentials,
-    MonitoringConfig,
-    NeuroAuthConfig,
-    NodePool,
-    NodePoolOptions,
-    NodeRole,
-    NotificationType,
-    OnPremCloudProvider,
-    OpenStackCredentials,
-    OrchestratorConfig,
-    PatchClusterRequest,
-    PatchNodePoolResourcesRequest,
-    PatchNodePoolSizeRequest,
-    PatchOrchestratorConfigRequest,
-    PutNodePoolRequest,
-    RegistryConfig,
-    ResourcePoolType,
-    ResourcePreset,
-    Resources,
-    SecretsConfig,
-    SentryCredentials,
-    Storage,
-    StorageConfig,
-    StorageInstance,
-    TPUPreset,
-    TPUResource,
-    VCDCloudProvider,
-    VCDCloudProviderOptions,
-    VCDCredentials,
-    VCDStorage,
-    VolumeConfig,
-)
+if TYPE_CHECKING:
+    from .client import ConfigClient, ConfigClientBase
+    from .entities import (
+        ACMEEnvironment,
+        AddNodePoolRequest,
+        ARecord,
+        AWSCloudProvider,
+        AWSCredentials,
+        AWSStorage,
+        AzureCloudProvider,
+        AzureCredentials,
+        AzureReplicationType,
+        AzureStorage,
+        AzureStorageTier,
+        BucketsConfig,
+        CloudProvider,
+        CloudProviderOptions,
+        CloudProviderType,
+        Cluster,
+        ClusterLocationType,
+        ClusterStatus,
+        CredentialsConfig,
+        DisksConfig,
+        DNSConfig,
+        DockerRegistryConfig,
+        EFSPerformanceMode,
+        EFSThroughputMode,
+        EMCECSCredentials,
+        EnergyConfig,
+        EnergySchedule,
+        EnergySchedulePeriod,
+        GoogleCloudProvider,
+        GoogleFilestoreTier,
+        GoogleStorage,
+        GrafanaCredentials,
+        HelmRegistryConfig,
+        IdleJobConfig,
+        IngressConfig,
+        MetricsConfig,
+        MinioCredentials,
+        MonitoringConfig,
+        NeuroAuthConfig,
+        NodePool,
+        NodePoolOptions,
+        NodeRole,
+        NotificationType,
+        OnPremCloudProvider,
+        OpenStackCredentials,
+        OrchestratorConfig,
+        PatchClusterRequest,
+        PatchNodePoolResourcesRequest,
+        PatchNodePoolSizeRequest,
+        PatchOrchestratorConfigRequest,
+        PutNodePoolRequest,
+        RegistryConfig,
+        ResourcePoolType,
+        ResourcePreset,
+        Resources,
+        SecretsConfig,
+        SentryCredentials,
+        Storage,
+        StorageConfig,
+        StorageInstance,
+        TPUPreset,
+        TPUResource,
+        VCDCloudProvider,
+        VCDCloudProviderOptions,
+        VCDCredentials,
+        VCDStorage,
+        VolumeConfig,
+    )
 
 __all__ = [
     "ConfigClient",
@@ -144,4 +147,23 @@ __all__ = [
     "VCDStorage",
     "VolumeConfig",
 ]
-__version__ = version(__name__)
+
+_CLIENT_NAMES = frozenset({"ConfigClient", "ConfigClientBase"})
+_LAZY_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    # Public names are imported on first access to keep package import cheap.
+    if name == "__version__":
+        globals()[name] = value = version(__name__)
+        return value
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = ".client" if name in _CLIENT_NAMES else ".entities"
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, "__version__"})
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import functools
 import logging
-from collections.abc import AsyncIterator, Mapping, Sequence
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+import time
+from collections import OrderedDict
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import (
+    AbstractAsyncContextManager,
+    asynccontextmanager,
+    contextmanager,
+    suppress,
+)
 from dataclasses import dataclass
-from types import TracebackType
-from typing import Any
+from types import MappingProxyType, TracebackType
+from typing import Any, Literal, NoReturn, TypeVar, overload
 
 import aiohttp
+import orjson
 from aiohttp import ClientResponseError
 from yarl import URL
 
@@ -27,8 +46,66 @@ from .entities import (
 )
 from .factories import EntityFactory, PayloadFactory
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_NOTIFY_BATCH_SIZE = 10
+
+_BULK_CONCURRENCY = 16
+
+_CACHE_MAX_SIZE = 256
+
+# Expired entries are kept this long to be revalidated with their ETag
+_CACHE_STALE_S = 600
+
+_START_DEPLOYMENT_PARAMS: Mapping[bool, Mapping[str, str]] = MappingProxyType(
+    {
+        True: MappingProxyType({"start_deployment": "true"}),
+        False: MappingProxyType({"start_deployment": "false"}),
+    }
+)
+
+# Bodies of notifications without a message, serialized only once
+_NOTIFY_BODIES: Mapping[NotificationType, bytes] = MappingProxyType(
+    {nt: orjson.dumps({"notification_type": nt.value}) for nt in NotificationType}
+)
+
+
+def _dump_json(obj: Any) -> bytes:
+    return orjson.dumps(obj)
+
+
+async def _gather_bounded(aws: Iterable[Awaitable[_T]], limit: int) -> list[_T]:
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[_T]) -> _T:
+        try:
+            async with semaphore:
+                return await aw
+        finally:
+            if asyncio.iscoroutine(aw):
+                aw.close()  # never started if cancelled while waiting
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # don't leave the rest running unobserved after the first failure
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    return orjson.loads(await response.read())
+
 
 @dataclass(frozen=True)
 class _Endpoints:
@@ -63,11 +140,49 @@ class _Endpoints:
         return f"{self.resource_presets(cluster_name)}/{preset_name}"
 
 
+@dataclass(frozen=True)
+class _Notification:
+    cluster_name: str
+    notification_type: NotificationType
+    message: str | None
+    token: str | None
+
+
+@dataclass
+class _InflightRequest:
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    expires_at: float
+    etag: str | None
+    value: Any
+
+
 class ConfigClientBase:
-    def __init__(self) -> None:
+    """Config service client.
+
+    With cache_ttl_s > 0, GET results are cached for that many seconds.
+    Cached entities are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self, *, cache_ttl_s: float = 0, notify_drain_timeout_s: float = 10
+    ) -> None:
         self._endpoints = _Endpoints()
         self._entity_factory = EntityFactory()
         self._payload_factory = PayloadFactory()
+        self._cache_ttl_s = cache_ttl_s
+        self._cache: OrderedDict[tuple[str, str | None], _CacheEntry] = OrderedDict()
+        self._cache_generation = 0
+        self._inflight: dict[tuple[str, str | None], _InflightRequest] = {}
+        self._notify_queue: asyncio.Queue[_Notification] | None = None
+        self._notify_worker: asyncio.Task[None] | None = None
+        # Queued notifications and the ones being sent
+        self._notify_unfinished = 0
+        self._notify_drain_timeout_s = notify_drain_timeout_s
 
     @abc.abstractmethod
     def _request(
@@ -77,59 +192,229 @@ class ConfigClientBase:
         json: dict[str, Any] | None = None,
         params: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
+        token: str | None = None,
+        data: bytes | None = None,
     ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
         pass
 
-    def _create_headers(self, *, token: str | None = None) -> dict[str, str]:
-        result = {}
-        if token:
-            result["Authorization"] = f"Bearer {token}"
-        return result
+    async def _json_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: Mapping[str, str] | None = None,
+        token: str | None = None,
+    ) -> Any:
+        async with self._request(
+            method, path, json=json, params=params, token=token
+        ) as response:
+            return await _read_json(response)
+
+    async def _get(
+        self,
+        path: str,
+        create_entity: Callable[[Any], _T],
+        *,
+        token: str | None = None,
+    ) -> _T:
+        # Concurrent identical GETs share a single request. It runs in its own
+        # task, so a cancelled caller does not cancel the others; it is
+        # cancelled once all of its callers are.
+        key = (path, token)
+        request = self._inflight.get(key)
+        if request is None:
+            task = asyncio.ensure_future(self._fetch(path, create_entity, token=token))
+            request = _InflightRequest(task)
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+            self._inflight[key] = request
+        request.waiters += 1
+        try:
+            return await asyncio.shield(request.task)
+        finally:
+            request.waiters -= 1
+            if not request.waiters:
+                request.task.cancel()
+
+    def _forget_inflight(
+        self, key: tuple[str, str | None], task: asyncio.Future[Any]
+    ) -> None:
+        request = self._inflight.get(key)
+        if request is not None and request.task is task:
+            del self._inflight[key]
+
+    async def _fetch(
+        self,
+        path: str,
+        create_entity: Callable[[Any], _T],
+        *,
+        token: str | None = None,
+    ) -> _T:
+        if self._cache_ttl_s <= 0:
+            return create_entity(await self._json_request("GET", path, token=token))
+        key = (path, token)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry and now < entry.expires_at:
+            self._cache.move_to_end(key)
+            return entry.value
+        if entry and now >= entry.expires_at + _CACHE_STALE_S:
+            entry = None
+        generation = self._cache_generation
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+        async with self._request("GET", path, headers=headers, token=token) as response:
+            if entry and response.status == 304:
+                if generation == self._cache_generation:
+                    entry.expires_at = now + self._cache_ttl_s
+                    self._put_cache_entry(key, entry, now)
+                return entry.value
+            value = create_entity(await _read_json(response))
+            if generation == self._cache_generation:
+                entry = _CacheEntry(
+                    expires_at=now + self._cache_ttl_s,
+                    etag=response.headers.get("ETag"),
+                    value=value,
+                )
+                self._put_cache_entry(key, entry, now)
+            return value
+
+    def _put_cache_entry(
+        self, key: tuple[str, str | None], entry: _CacheEntry, now: float
+    ) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        # Evict least recently used entries and the ones expired long ago
+        while self._cache:
+            oldest = next(iter(self._cache.values()))
+            if (
+                len(self._cache) <= _CACHE_MAX_SIZE
+                and now < oldest.expires_at + _CACHE_STALE_S
+            ):
+                break
+            self._cache.popitem(last=False)
+
+    async def _read_cluster(
+        self, response: aiohttp.ClientResponse, parse: bool = True
+    ) -> Cluster | None:
+        if not parse:
+            await response.read()  # drain the body so the connection is reused
+            return None
+        return self._entity_factory.create_cluster(await _read_json(response))
+
+    async def _iter(
+        self,
+        path: str,
+        create_entity: Callable[[Any], _T],
+        *,
+        token: str | None = None,
+    ) -> AsyncGenerator[_T, None]:
+        if ijson is None:
+            payload = await self._json_request("GET", path, token=token)
+            for item in payload:
+                yield create_entity(item)
+            return
+        async with self._request("GET", path, token=token) as response:
+            items = ijson.items_async(response.content, "item", use_float=True)
+            async for item in items:
+                yield create_entity(item)
+
+    @contextmanager
+    def _invalidating_cache(self, cluster_name: str) -> Iterator[None]:
+        # Invalidate after the mutation too: GETs started in the meantime
+        # may have read the previous state.
+        self._invalidate_cache(cluster_name)
+        try:
+            yield
+        finally:
+            self._invalidate_cache(cluster_name)
+
+    def _invalidate_cache(self, cluster_name: str) -> None:
+        # Results of GETs that are still in flight are not cached
+        self._cache_generation += 1
+        prefix = self._endpoints.cluster(cluster_name)
+
+        def is_stale(key: tuple[str, str | None]) -> bool:
+            path = key[0]
+            return (
+                path == self._endpoints.clusters
+                or path == prefix
+                or path.startswith(prefix + "/")
+            )
+
+        for key in [key for key in self._cache if is_stale(key)]:
+            del self._cache[key]
+        # Later GETs must not join requests started before the mutation
+        for key in [key for key in self._inflight if is_stale(key)]:
+            del self._inflight[key]
+
+    def _create_cloud_provider_options_list(
+        self, payload: dict[str, Any]
+    ) -> list[CloudProviderOptions]:
+        create = self._entity_factory.create_cloud_provider_options
+        return [create(CloudProviderType(k), v) for k, v in payload.items()]
 
     async def list_cloud_provider_options(
         self, *, token: str | None = None
     ) -> list[CloudProviderOptions]:
-        path = self._endpoints.cloud_providers
-        async with self._request(
-            "GET", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            result: list[CloudProviderOptions] = []
-            for k, v in resp_payload.items():
-                result.append(
-                    self._entity_factory.create_cloud_provider_options(
-                        CloudProviderType(k), v
-                    )
-                )
-            return result
+        result = await self._get(
+            self._endpoints.cloud_providers,
+            self._create_cloud_provider_options_list,
+            token=token,
+        )
+        return list(result)
 
     async def get_cloud_provider_options(
         self, type: CloudProviderType, *, token: str | None = None
     ) -> CloudProviderOptions:
-        path = self._endpoints.cloud_provider_options(type)
-        async with self._request(
-            "GET", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cloud_provider_options(
-                type, resp_payload
-            )
+        return await self._get(
+            self._endpoints.cloud_provider_options(type),
+            lambda p: self._entity_factory.create_cloud_provider_options(type, p),
+            token=token,
+        )
 
     async def list_clusters(self, *, token: str | None = None) -> Sequence[Cluster]:
-        async with self._request(
-            "GET", self._endpoints.clusters, headers=self._create_headers(token=token)
-        ) as response:
-            payload = await response.json()
-            return [self._entity_factory.create_cluster(p) for p in payload]
+        result = await self._get(
+            self._endpoints.clusters,
+            lambda payload: list(map(self._entity_factory.create_cluster, payload)),
+            token=token,
+        )
+        return list(result)
+
+    def iter_clusters(
+        self, *, token: str | None = None
+    ) -> AsyncGenerator[Cluster, None]:
+        """Iterate over clusters as they are parsed from the response.
+
+        With ijson installed the response is streamed and the connection
+        is held until the iteration ends. If the loop may exit early, wrap
+        the iterator in contextlib.aclosing() or call its aclose() method.
+        """
+        return self._iter(
+            self._endpoints.clusters, self._entity_factory.create_cluster, token=token
+        )
 
     async def get_cluster(self, name: str, *, token: str | None = None) -> Cluster:
-        async with self._request(
-            "GET",
+        return await self._get(
             self._endpoints.cluster(name),
-            headers=self._create_headers(token=token),
-        ) as response:
-            payload = await response.json()
-            return self._entity_factory.create_cluster(payload)
+            self._entity_factory.create_cluster,
+            token=token,
+        )
+
+    async def get_clusters_bulk(
+        self,
+        names: Sequence[str],
+        *,
+        token: str | None = None,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> list[Cluster]:
+        """Fetch several clusters concurrently.
+
+        Results are returned in the same order as names.
+        At most `concurrency` requests are in flight at a time.
+        """
+        return await _gather_bounded(
+            (self.get_cluster(n, token=token) for n in names), concurrency
+        )
 
     async def create_blank_cluster(
         self,
@@ -141,38 +426,41 @@ class ConfigClientBase:
     ) -> Cluster:
         payload = {"name": name, "token": service_token}
         try:
-            async with self._request(
-                "POST",
-                self._endpoints.clusters,
-                headers=self._create_headers(token=token),
-                json=payload,
-            ) as resp:
-                resp_payload = await resp.json()
-                return self._entity_factory.create_cluster(resp_payload)
+            with self._invalidating_cache(name):
+                resp_payload = await self._json_request(
+                    "POST",
+                    self._endpoints.clusters,
+                    token=token,
+                    json=payload,
+                )
+            return self._entity_factory.create_cluster(resp_payload)
         except ClientResponseError as e:
-            is_existing = e.status == 400 and "already exists" in e.message
-            if not ignore_existing or is_existing:
+            is_existing = e.status == 409 or (
+                e.status == 400 and "already exists" in e.message
+            )
+            if not ignore_existing or not is_existing:
                 raise
-        return await self.get_cluster(name)
+        return await self.get_cluster(name, token=token)
 
     async def patch_cluster(
         self, name: str, request: PatchClusterRequest, *, token: str | None = None
     ) -> Cluster:
         path = self._endpoints.cluster(name)
         payload = self._payload_factory.create_patch_cluster_request(request)
-        async with self._request(
-            "PATCH", path, headers=self._create_headers(token=token), json=payload
-        ) as resp:
-            resp_payload = await resp.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(name):
+            resp_payload = await self._json_request(
+                "PATCH", path, token=token, json=payload
+            )
+        return self._entity_factory.create_cluster(resp_payload)
 
     async def delete_cluster(self, name: str, *, token: str | None = None) -> None:
-        async with self._request(
-            "DELETE",
-            self._endpoints.cluster(name),
-            headers=self._create_headers(token=token),
-        ):
-            pass
+        with self._invalidating_cache(name):
+            async with self._request(
+                "DELETE",
+                self._endpoints.cluster(name),
+                token=token,
+            ):
+                pass
 
     async def add_storage(
         self,
@@ -189,15 +477,15 @@ class ConfigClientBase:
             payload: dict[str, Any] = {"name": storage_name}
             if size is not None:
                 payload["size"] = size
-            async with self._request(
-                "POST",
-                path,
-                params={"start_deployment": str(start_deployment).lower()},
-                headers=self._create_headers(token=token),
-                json=payload,
-            ) as response:
-                resp_payload = await response.json()
-                return self._entity_factory.create_cluster(resp_payload)
+            with self._invalidating_cache(cluster_name):
+                resp_payload = await self._json_request(
+                    "POST",
+                    path,
+                    params=_START_DEPLOYMENT_PARAMS[start_deployment],
+                    token=token,
+                    json=payload,
+                )
+            return self._entity_factory.create_cluster(resp_payload)
         except ClientResponseError as e:
             if not ignore_existing or e.status != 409:
                 raise
@@ -220,16 +508,17 @@ class ConfigClientBase:
             payload: dict[str, Any] = {}
             if ready is not None:
                 payload["ready"] = ready
-            async with self._request(
-                "PATCH", path, headers=self._create_headers(token=token), json=payload
-            ) as response:
-                resp_payload = await response.json()
-                return self._entity_factory.create_cluster(resp_payload)
+            with self._invalidating_cache(cluster_name):
+                resp_payload = await self._json_request(
+                    "PATCH", path, token=token, json=payload
+                )
+            return self._entity_factory.create_cluster(resp_payload)
         except ClientResponseError as e:
             if not ignore_not_found or e.status != 404:
                 raise
         return await self.get_cluster(cluster_name)
 
+    @overload
     async def remove_storage(
         self,
         cluster_name: str,
@@ -237,42 +526,101 @@ class ConfigClientBase:
         *,
         start_deployment: bool = True,
         ignore_not_found: bool = False,
+        return_cluster: Literal[True] = True,
         token: str | None = None,
     ) -> Cluster:
+        pass
+
+    @overload
+    async def remove_storage(
+        self,
+        cluster_name: str,
+        storage_name: str,
+        *,
+        start_deployment: bool = True,
+        ignore_not_found: bool = False,
+        return_cluster: Literal[False],
+        token: str | None = None,
+    ) -> None:
+        pass
+
+    async def remove_storage(
+        self,
+        cluster_name: str,
+        storage_name: str,
+        *,
+        start_deployment: bool = True,
+        ignore_not_found: bool = False,
+        return_cluster: bool = True,
+        token: str | None = None,
+    ) -> Cluster | None:
         try:
             path = self._endpoints.storage(cluster_name, storage_name)
-            async with self._request(
-                "DELETE",
-                path,
-                params={"start_deployment": str(start_deployment).lower()},
-                headers=self._create_headers(token=token),
-            ) as response:
-                resp_payload = await response.json()
-                return self._entity_factory.create_cluster(resp_payload)
+            with self._invalidating_cache(cluster_name):
+                async with self._request(
+                    "DELETE",
+                    path,
+                    params=_START_DEPLOYMENT_PARAMS[start_deployment],
+                    token=token,
+                ) as response:
+                    return await self._read_cluster(response, return_cluster)
         except ClientResponseError as e:
             if not ignore_not_found or e.status != 404:
                 raise
+        if not return_cluster:
+            return None
         return await self.get_cluster(cluster_name)
 
     async def get_node_pool(
         self, cluster_name: str, node_pool_name: str, *, token: str | None = None
     ) -> NodePool:
-        path = self._endpoints.node_pool(cluster_name, node_pool_name)
-        async with self._request(
-            "GET", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_node_pool(resp_payload)
+        return await self._get(
+            self._endpoints.node_pool(cluster_name, node_pool_name),
+            self._entity_factory.create_node_pool,
+            token=token,
+        )
 
     async def list_node_pools(
         self, cluster_name: str, *, token: str | None = None
     ) -> list[NodePool]:
-        path = self._endpoints.node_pools(cluster_name)
-        async with self._request(
-            "GET", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            return [self._entity_factory.create_node_pool(n) for n in resp_payload]
+        result = await self._get(
+            self._endpoints.node_pools(cluster_name),
+            lambda payload: list(map(self._entity_factory.create_node_pool, payload)),
+            token=token,
+        )
+        return list(result)
+
+    def iter_node_pools(
+        self, cluster_name: str, *, token: str | None = None
+    ) -> AsyncGenerator[NodePool, None]:
+        """Iterate over node pools as they are parsed from the response.
+
+        With ijson installed the response is streamed and the connection
+        is held until the iteration ends. If the loop may exit early, wrap
+        the iterator in contextlib.aclosing() or call its aclose() method.
+        """
+        return self._iter(
+            self._endpoints.node_pools(cluster_name),
+            self._entity_factory.create_node_pool,
+            token=token,
+        )
+
+    async def list_node_pools_bulk(
+        self,
+        cluster_names: Sequence[str],
+        *,
+        token: str | None = None,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> list[list[NodePool]]:
+        """Fetch node pools of several clusters concurrently.
+
+        Results are returned in the same order as cluster_names.
+        At most `concurrency` requests are in flight at a time.
+        """
+        return await _gather_bounded(
+            (self.list_node_pools(n, token=token) for n in cluster_names),
+            concurrency,
+        )
 
     async def add_node_pool(
         self,
@@ -300,15 +648,47 @@ class ConfigClientBase:
         """
         path = self._endpoints.node_pools(cluster_name)
         payload = self._payload_factory.create_add_node_pool_request(node_pool)
-        async with self._request(
-            "POST",
-            path,
-            params={"start_deployment": str(start_deployment).lower()},
-            headers=self._create_headers(token=token),
-            json=payload,
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            resp_payload = await self._json_request(
+                "POST",
+                path,
+                params=_START_DEPLOYMENT_PARAMS[start_deployment],
+                token=token,
+                json=payload,
+            )
+        return self._entity_factory.create_cluster(resp_payload)
+
+    async def add_node_pools(
+        self,
+        cluster_name: str,
+        node_pools: Sequence[AddNodePoolRequest],
+        *,
+        start_deployment: bool = True,
+        token: str | None = None,
+    ) -> Cluster:
+        """Add several node pools to the existing cluster.
+
+        Node pools are added one by one without starting a deployment,
+        the deployment is started (if requested) only with the last one.
+
+        Args:
+            cluster_name (str): Name of the cluster within the platform.
+            node_pools (Sequence[NodePool]): Node pool instances, at least one.
+            start_deployment (bool, optional): Start applying changes. Defaults to True.
+
+        Returns:
+            Cluster: Cluster instance with applied changes
+        """
+        if not node_pools:
+            raise ValueError("At least one node pool is required")
+        *head, last = node_pools
+        for node_pool in head:
+            await self.add_node_pool(
+                cluster_name, node_pool, start_deployment=False, token=token
+            )
+        return await self.add_node_pool(
+            cluster_name, last, start_deployment=start_deployment, token=token
+        )
 
     async def put_node_pool(
         self,
@@ -320,15 +700,15 @@ class ConfigClientBase:
     ) -> Cluster:
         path = self._endpoints.node_pool(cluster_name, node_pool.name)
         payload = self._payload_factory.create_add_node_pool_request(node_pool)
-        async with self._request(
-            "PUT",
-            path,
-            params={"start_deployment": str(start_deployment).lower()},
-            headers=self._create_headers(token=token),
-            json=payload,
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            resp_payload = await self._json_request(
+                "PUT",
+                path,
+                params=_START_DEPLOYMENT_PARAMS[start_deployment],
+                token=token,
+                json=payload,
+            )
+        return self._entity_factory.create_cluster(resp_payload)
 
     async def patch_node_pool(
         self,
@@ -341,33 +721,58 @@ class ConfigClientBase:
     ) -> Cluster:
         path = self._endpoints.node_pool(cluster_name, node_pool_name)
         payload = self._payload_factory.create_patch_node_pool_request(request)
-        async with self._request(
-            "PATCH",
-            path,
-            params={"start_deployment": str(start_deployment).lower()},
-            headers=self._create_headers(token=token),
-            json=payload,
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            resp_payload = await self._json_request(
+                "PATCH",
+                path,
+                params=_START_DEPLOYMENT_PARAMS[start_deployment],
+                token=token,
+                json=payload,
+            )
+        return self._entity_factory.create_cluster(resp_payload)
 
+    @overload
     async def delete_node_pool(
         self,
         cluster_name: str,
         node_pool_name: str,
         *,
         start_deployment: bool = True,
+        return_cluster: Literal[True] = True,
         token: str | None = None,
     ) -> Cluster:
+        pass
+
+    @overload
+    async def delete_node_pool(
+        self,
+        cluster_name: str,
+        node_pool_name: str,
+        *,
+        start_deployment: bool = True,
+        return_cluster: Literal[False],
+        token: str | None = None,
+    ) -> None:
+        pass
+
+    async def delete_node_pool(
+        self,
+        cluster_name: str,
+        node_pool_name: str,
+        *,
+        start_deployment: bool = True,
+        return_cluster: bool = True,
+        token: str | None = None,
+    ) -> Cluster | None:
         path = self._endpoints.node_pool(cluster_name, node_pool_name)
-        async with self._request(
-            "DELETE",
-            path,
-            params={"start_deployment": str(start_deployment).lower()},
-            headers=self._create_headers(token=token),
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            async with self._request(
+                "DELETE",
+                path,
+                params=_START_DEPLOYMENT_PARAMS[start_deployment],
+                token=token,
+            ) as response:
+                return await self._read_cluster(response, return_cluster)
 
     async def notify(
         self,
@@ -378,67 +783,236 @@ class ConfigClientBase:
         token: str | None = None,
     ) -> None:
         path = self._endpoints.notifications(cluster_name)
-        payload = {"notification_type": notification_type.value}
+        payload: dict[str, Any] | None = None
+        data: bytes | None = None
         if message:
+            payload = {"notification_type": notification_type.value}
             payload["message"] = message
-        async with self._request(
-            "POST", path, headers=self._create_headers(token=token), json=payload
-        ):
+        else:
+            data = _NOTIFY_BODIES[notification_type]
+        async with self._request("POST", path, token=token, json=payload, data=data):
             pass
 
+    async def notify_many(
+        self,
+        cluster_name: str,
+        notifications: Sequence[tuple[NotificationType, str | None]],
+        *,
+        token: str | None = None,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> None:
+        """Send several notifications for a cluster concurrently.
+
+        The config service accepts one notification per request, so requests
+        are sent in parallel over the shared connection pool.
+        At most `concurrency` requests are in flight at a time.
+        """
+        await _gather_bounded(
+            (
+                self.notify(cluster_name, notification_type, message, token=token)
+                for notification_type, message in notifications
+            ),
+            concurrency,
+        )
+
+    def enqueue_notify(
+        self,
+        cluster_name: str,
+        notification_type: NotificationType,
+        message: str | None = None,
+        *,
+        token: str | None = None,
+    ) -> None:
+        """Schedule a notification without waiting for it to be sent.
+
+        Notifications are sent by a background task; failures are logged
+        and otherwise ignored.
+        """
+        if self._notify_queue is None:
+            self._notify_queue = asyncio.Queue()
+            self._notify_worker = asyncio.create_task(
+                self._run_notify_worker(self._notify_queue)
+            )
+        self._notify_unfinished += 1
+        self._notify_queue.put_nowait(
+            _Notification(
+                cluster_name=cluster_name,
+                notification_type=notification_type,
+                message=message,
+                token=token,
+            )
+        )
+
+    async def _run_notify_worker(self, queue: asyncio.Queue[_Notification]) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _NOTIFY_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            results = await asyncio.gather(
+                *(
+                    self.notify(
+                        n.cluster_name, n.notification_type, n.message, token=n.token
+                    )
+                    for n in batch
+                ),
+                return_exceptions=True,
+            )
+            for notification, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        "Failed to send %s notification for cluster %s",
+                        notification.notification_type.value,
+                        notification.cluster_name,
+                        exc_info=result,
+                    )
+                self._notify_unfinished -= 1
+                queue.task_done()
+
+    async def aclose(self) -> None:
+        """Send queued notifications, stop the background worker and
+        cancel GET requests that are still in flight.
+
+        Waits at most notify_drain_timeout_s for queued notifications
+        to be sent, the rest are dropped.
+        """
+        await self._close_notify_worker()
+        await self._cancel_inflight()
+
+    async def _cancel_inflight(self) -> None:
+        tasks = [request.task for request in self._inflight.values()]
+        self._inflight.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _close_notify_worker(self) -> None:
+        if self._notify_queue is None or self._notify_worker is None:
+            return
+        try:
+            await asyncio.wait_for(
+                self._notify_queue.join(), self._notify_drain_timeout_s
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Timed out sending notifications on close, %d dropped",
+                self._notify_unfinished,
+            )
+        self._notify_worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._notify_worker
+        self._notify_queue = None
+        self._notify_worker = None
+        self._notify_unfinished = 0
+
     async def list_resource_presets(
         self, cluster_name: str, *, token: str | None = None
     ) -> list[ResourcePreset]:
-        path = self._endpoints.resource_presets(cluster_name)
-        async with self._request(
-            "GET", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            return [
-                self._entity_factory.create_resource_preset(p) for p in resp_payload
-            ]
+        result = await self._get(
+            self._endpoints.resource_presets(cluster_name),
+            lambda payload: list(
+                map(self._entity_factory.create_resource_preset, payload)
+            ),
+            token=token,
+        )
+        return list(result)
+
+    def iter_resource_presets(
+        self, cluster_name: str, *, token: str | None = None
+    ) -> AsyncGenerator[ResourcePreset, None]:
+        """Iterate over resource presets as they are parsed from the response.
+
+        With ijson installed the response is streamed and the connection
+        is held until the iteration ends. If the loop may exit early, wrap
+        the iterator in contextlib.aclosing() or call its aclose() method.
+        """
+        return self._iter(
+            self._endpoints.resource_presets(cluster_name),
+            self._entity_factory.create_resource_preset,
+            token=token,
+        )
+
+    async def list_resource_presets_bulk(
+        self,
+        cluster_names: Sequence[str],
+        *,
+        token: str | None = None,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> list[list[ResourcePreset]]:
+        """Fetch resource presets of several clusters concurrently.
+
+        Results are returned in the same order as cluster_names.
+        At most `concurrency` requests are in flight at a time.
+        """
+        return await _gather_bounded(
+            (self.list_resource_presets(n, token=token) for n in cluster_names),
+            concurrency,
+        )
 
     async def get_resource_preset(
         self, cluster_name: str, preset_name: str, *, token: str | None = None
     ) -> ResourcePreset:
-        path = self._endpoints.resource_preset(cluster_name, preset_name)
-        async with self._request(
-            "GET", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_resource_preset(resp_payload)
+        return await self._get(
+            self._endpoints.resource_preset(cluster_name, preset_name),
+            self._entity_factory.create_resource_preset,
+            token=token,
+        )
 
     async def add_resource_preset(
         self, cluster_name: str, preset: ResourcePreset, *, token: str | None = None
     ) -> Cluster:
         path = self._endpoints.resource_presets(cluster_name)
         payload = self._payload_factory.create_resource_preset(preset)
-        async with self._request(
-            "POST", path, headers=self._create_headers(token=token), json=payload
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            resp_payload = await self._json_request(
+                "POST", path, token=token, json=payload
+            )
+        return self._entity_factory.create_cluster(resp_payload)
 
     async def put_resource_preset(
         self, cluster_name: str, preset: ResourcePreset, *, token: str | None = None
     ) -> Cluster:
         path = self._endpoints.resource_preset(cluster_name, preset.name)
         payload = self._payload_factory.create_resource_preset(preset)
-        async with self._request(
-            "PUT", path, headers=self._create_headers(token=token), json=payload
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            resp_payload = await self._json_request(
+                "PUT", path, token=token, json=payload
+            )
+        return self._entity_factory.create_cluster(resp_payload)
 
+    @overload
     async def delete_resource_preset(
-        self, cluster_name: str, preset_name: str, *, token: str | None = None
+        self,
+        cluster_name: str,
+        preset_name: str,
+        *,
+        return_cluster: Literal[True] = True,
+        token: str | None = None,
     ) -> Cluster:
+        pass
+
+    @overload
+    async def delete_resource_preset(
+        self,
+        cluster_name: str,
+        preset_name: str,
+        *,
+        return_cluster: Literal[False],
+        token: str | None = None,
+    ) -> None:
+        pass
+
+    async def delete_resource_preset(
+        self,
+        cluster_name: str,
+        preset_name: str,
+        *,
+        return_cluster: bool = True,
+        token: str | None = None,
+    ) -> Cluster | None:
         path = self._endpoints.resource_preset(cluster_name, preset_name)
-        async with self._request(
-            "DELETE", path, headers=self._create_headers(token=token)
-        ) as response:
-            resp_payload = await response.json()
-            return self._entity_factory.create_cluster(resp_payload)
+        with self._invalidating_cache(cluster_name):
+            async with self._request("DELETE", path, token=token) as response:
+                return await self._read_cluster(response, return_cluster)
 
 
 class ConfigClient(ConfigClientBase):
@@ -448,17 +1022,38 @@ class ConfigClient(ConfigClientBase):
         token: str | None = None,
         timeout: aiohttp.ClientTimeout = aiohttp.client.DEFAULT_TIMEOUT,
         trace_configs: Sequence[aiohttp.TraceConfig] = (),
+        cache_ttl_s: float = 0,
+        notify_drain_timeout_s: float = 10,
+        connector: aiohttp.BaseConnector | None = None,
+        connector_limit: int = 32,
+        connector_limit_per_host: int = 32,
     ):
-        super().__init__()
+        super().__init__(
+            cache_ttl_s=cache_ttl_s, notify_drain_timeout_s=notify_drain_timeout_s
+        )
 
         self._base_url = url / "api/v1"
         self._token = token
+        self._default_headers = self._create_default_headers()
         self._timeout = timeout
-        self._trace_configs = trace_configs
+        self._trace_configs = list(trace_configs)
+        self._connector = connector
+        self._connector_limit = connector_limit
+        self._connector_limit_per_host = connector_limit_per_host
         self._client: aiohttp.ClientSession | None = None
+        # Bound ClientSession.request of the current session
+        self._send: Callable[..., Any] = self._send_not_entered
+        self._entered = 0
+        self._resolve_url = functools.lru_cache(maxsize=256)(self._build_url)
+        self._get_common_headers = functools.lru_cache(maxsize=32)(
+            self._create_common_headers
+        )
 
     async def __aenter__(self) -> ConfigClient:
-        self._client = await self._create_http_client()
+        if self._client is None or self._client.closed:
+            self._client = await self._create_http_client()
+            self._send = self._client.request
+        self._entered += 1
         return self
 
     async def __aexit__(
@@ -467,25 +1062,121 @@ class ConfigClient(ConfigClientBase):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        await self.aclose()
+        self._entered -= 1
+        if self._entered <= 0:
+            await self.aclose()
 
     async def aclose(self) -> None:
         assert self._client
+        self._entered = 0
+        await super().aclose()
+        self._send = self._send_not_entered
         await self._client.close()
 
+    def _send_not_entered(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise RuntimeError("ConfigClient is used outside of 'async with' block")
+
     async def _create_http_client(self) -> aiohttp.ClientSession:
+        connector = self._connector
+        if connector is None:
+            # All requests go to a single host, so keep a small pool of
+            # long-lived connections instead of reconnecting after the
+            # default 15s idle time. Idle connections are closed before
+            # the server's keep-alive timeout (75s in aiohttp) closes them.
+            connector = aiohttp.TCPConnector(
+                limit=self._connector_limit,
+                limit_per_host=self._connector_limit_per_host,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
         client = aiohttp.ClientSession(
-            headers=self._create_default_headers(),
+            connector=connector,
+            # a connector passed by the caller may be shared with other clients
+            connector_owner=self._connector is None,
+            headers=self._default_headers,
             timeout=self._timeout,
-            trace_configs=list(self._trace_configs),
+            trace_configs=self._trace_configs,
         )
         return await client.__aenter__()
 
-    def _create_default_headers(self) -> dict[str, str]:
+    def _create_default_headers(self) -> Mapping[str, str]:
         result = {}
         if self._token:
             result["Authorization"] = f"Bearer {self._token}"
-        return result
+        return MappingProxyType(result)
+
+    def _build_url(self, path: str, params: tuple[tuple[str, str], ...]) -> URL:
+        url = self._base_url / path
+        if params:
+            url = url.with_query(params)
+        return url
+
+    def _create_request_headers(
+        self,
+        headers: Mapping[str, str] | None,
+        token: str | None,
+        has_body: bool,
+    ) -> Mapping[str, str] | None:
+        if token == self._token:
+            token = None  # already sent with the session default headers
+        common = self._get_common_headers(token, has_body)
+        if not headers:
+            return common
+        if not common:
+            return headers
+        return {**headers, **common}
+
+    def _create_common_headers(
+        self, token: str | None, has_body: bool
+    ) -> Mapping[str, str] | None:
+        if not token and not has_body:
+            return None
+        result = {}
+        if token:
+            result["Authorization"] = f"Bearer {token}"
+        if has_body:
+            result["Content-Type"] = "application/json"
+        return MappingProxyType(result)
+
+    def _send_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None,
+        data: bytes | None,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        token: str | None,
+    ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        url = self._resolve_url(path, tuple(params.items()) if params else ())
+        if json is not None:
+            data = _dump_json(json)
+        headers = self._create_request_headers(headers, token, data is not None)
+        return self._send(
+            method, url, data=data, headers=headers, raise_for_status=True
+        )
+
+    async def _json_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: Mapping[str, str] | None = None,
+        token: str | None = None,
+    ) -> Any:
+        # Same as _request + _read_json, without the context manager wrapper
+        async with self._send_request(
+            method,
+            path,
+            json=json,
+            data=None,
+            params=params,
+            headers=None,
+            token=token,
+        ) as response:
+            return await _read_json(response)
 
     @asynccontextmanager
     async def _request(
@@ -495,15 +1186,16 @@ class ConfigClient(ConfigClientBase):
         json: dict[str, Any] | None = None,
         params: Mapping[str, str] | None = None,
         headers: Mapping[str, str] | None = None,
+        token: str | None = None,
+        data: bytes | None = None,
     ) -> AsyncIterator[aiohttp.ClientResponse]:
-        assert self._client
-        assert self._base_url
-        url = self._base_url / path
-        if params:
-            url = url.with_query(params)
-
-        async with self._client.request(
-            method, url, json=json, headers=headers
+        async with self._send_request(
+            method,
+            path,
+            json=json,
+            data=data,
+            params=params,
+            headers=headers,
+            token=token,
         ) as response:
-            response.raise_for_status()
             yield response
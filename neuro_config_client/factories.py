@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import sys
 from datetime import datetime, time, tzinfo
 from decimal import Decimal
-from typing import Any
+from enum import Enum
+from typing import Any, TypeVar
 
 from yarl import URL
 
@@ -82,6 +84,33 @@ else:
     from backports.zoneinfo._zoneinfo import ZoneInfo
 
 
+@functools.lru_cache(maxsize=1024)
+def _create_url(value: str) -> URL:
+    # the same service URLs repeat across clusters, parse each of them once
+    return URL(value)
+
+
+_E = TypeVar("_E", bound=Enum)
+
+
+@functools.lru_cache(maxsize=256)
+def _create_enum(enum_type: type[_E], value: Any) -> _E:
+    # skips the Enum metaclass call machinery for the few values each enum has
+    return enum_type(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _create_datetime(value: str) -> datetime:
+    # clusters are polled repeatedly with unchanged timestamps
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _create_decimal(value: str | int | float | Decimal) -> Decimal:
+    # prices are mostly a handful of repeated values
+    return Decimal(value)
+
+
 class EntityFactory:
     @classmethod
     def create_cloud_provider_options(
@@ -91,9 +120,9 @@ class EntityFactory:
             return cls._create_vcd_cloud_provider_options(type, payload)
         return CloudProviderOptions(
             type=type,
-            node_pools=[
-                cls.create_node_pool_options(p) for p in payload.get("node_pools", ())
-            ],
+            node_pools=list(
+                map(cls.create_node_pool_options, payload.get("node_pools", ()))
+            ),
         )
 
     @classmethod
@@ -103,10 +132,10 @@ class EntityFactory:
         url = payload.get("url")
         return VCDCloudProviderOptions(
             type=type,
-            node_pools=[
-                cls.create_node_pool_options(p) for p in payload.get("node_pools", ())
-            ],
-            url=URL(url) if url else None,
+            node_pools=list(
+                map(cls.create_node_pool_options, payload.get("node_pools", ()))
+            ),
+            url=_create_url(url) if url else None,
             organization=payload.get("organization"),
             edge_name_template=payload.get("edge_name_template"),
             edge_external_network_name=payload.get("edge_external_network_name"),
@@ -145,7 +174,7 @@ class EntityFactory:
         energy = payload.get("energy")
         return Cluster(
             name=payload["name"],
-            status=ClusterStatus(payload["status"]),
+            status=_create_enum(ClusterStatus, payload["status"]),
             platform_infra_image_tag=payload.get("platform_infra_image_tag"),
             orchestrator=(
                 self.create_orchestrator(orchestrator) if orchestrator else None
@@ -163,7 +192,7 @@ class EntityFactory:
                 self.create_cloud_provider(cloud_provider) if cloud_provider else None
             ),
             credentials=self.create_credentials(credentials) if credentials else None,
-            created_at=datetime.fromisoformat(payload["created_at"]),
+            created_at=_create_datetime(payload["created_at"]),
             timezone=timezone,
             energy=self.create_energy(energy, timezone=timezone) if energy else None,
         )
@@ -178,14 +207,15 @@ class EntityFactory:
             job_schedule_timeout_s=payload["job_schedule_timeout_s"],
             job_schedule_scale_up_timeout_s=payload["job_schedule_scale_up_timeout_s"],
             is_http_ingress_secure=payload["is_http_ingress_secure"],
-            resource_pool_types=[
-                self.create_resource_pool_type(r)
-                for r in payload.get("resource_pool_types", ())
-            ],
-            resource_presets=[
-                self.create_resource_preset(preset)
-                for preset in payload.get("resource_presets", ())
-            ],
+            resource_pool_types=list(
+                map(
+                    self.create_resource_pool_type,
+                    payload.get("resource_pool_types", ()),
+                )
+            ),
+            resource_presets=list(
+                map(self.create_resource_preset, payload.get("resource_presets", ()))
+            ),
             allow_privileged_mode=payload.get(
                 "allow_privileged_mode", OrchestratorConfig.allow_privileged_mode
             ),
@@ -193,9 +223,7 @@ class EntityFactory:
                 "allow_job_priority", OrchestratorConfig.allow_job_priority
             ),
             pre_pull_images=payload.get("pre_pull_images", ()),
-            idle_jobs=[
-                self.create_idle_job(job) for job in payload.get("idle_jobs", ())
-            ],
+            idle_jobs=list(map(self.create_idle_job, payload.get("idle_jobs", ()))),
         )
 
     def create_resource_pool_type(self, payload: dict[str, Any]) -> ResourcePoolType:
@@ -223,7 +251,7 @@ class EntityFactory:
             amd_gpu_model=payload.get("amd_gpu_model"),
             intel_gpu=payload.get("intel_gpu"),
             intel_gpu_model=payload.get("intel_gpu_model"),
-            price=Decimal(payload.get("price", ResourcePoolType.price)),
+            price=_create_decimal(payload.get("price", ResourcePoolType.price)),
             currency=payload.get("currency"),
             tpu=tpu,
             is_preemptible=payload.get(
@@ -236,8 +264,8 @@ class EntityFactory:
     def create_tpu_resource(self, payload: dict[str, Any]) -> TPUResource:
         return TPUResource(
             ipv4_cidr_block=payload["ipv4_cidr_block"],
-            types=list(payload["types"]),
-            software_versions=list(payload["software_versions"]),
+            types=payload["types"],
+            software_versions=payload["software_versions"],
         )
 
     def create_resource_preset(self, payload: dict[str, Any]) -> ResourcePreset:
@@ -246,7 +274,7 @@ class EntityFactory:
             tpu = self.create_tpu_preset(payload["tpu"])
         return ResourcePreset(
             name=payload["name"],
-            credits_per_hour=Decimal(payload["credits_per_hour"]),
+            credits_per_hour=_create_decimal(payload["credits_per_hour"]),
             cpu=payload["cpu"],
             memory=payload["memory"],
             nvidia_gpu=payload.get("nvidia_gpu"),
@@ -294,8 +322,8 @@ class EntityFactory:
 
     def create_storage(self, payload: dict[str, Any]) -> StorageConfig:
         return StorageConfig(
-            url=URL(payload["url"]),
-            volumes=[self.create_volume(e) for e in payload.get("volumes", ())],
+            url=_create_url(payload["url"]),
+            volumes=list(map(self.create_volume, payload.get("volumes", ()))),
         )
 
     def create_volume(self, payload: dict[str, Any]) -> VolumeConfig:
@@ -303,7 +331,7 @@ class EntityFactory:
             name=payload["name"],
             path=payload.get("path"),
             size=payload.get("size"),
-            credits_per_hour_per_gb=Decimal(
+            credits_per_hour_per_gb=_create_decimal(
                 payload.get(
                     "credits_per_hour_per_gb", VolumeConfig.credits_per_hour_per_gb
                 )
@@ -311,21 +339,21 @@ class EntityFactory:
         )
 
     def create_registry(self, payload: dict[str, Any]) -> RegistryConfig:
-        return RegistryConfig(url=URL(payload["url"]))
+        return RegistryConfig(url=_create_url(payload["url"]))
 
     def create_monitoring(self, payload: dict[str, Any]) -> MonitoringConfig:
-        return MonitoringConfig(url=URL(payload["url"]))
+        return MonitoringConfig(url=_create_url(payload["url"]))
 
     def create_secrets(self, payload: dict[str, Any]) -> SecretsConfig:
-        return SecretsConfig(url=URL(payload["url"]))
+        return SecretsConfig(url=_create_url(payload["url"]))
 
     def create_metrics(self, payload: dict[str, Any]) -> MetricsConfig:
-        return MetricsConfig(url=URL(payload["url"]))
+        return MetricsConfig(url=_create_url(payload["url"]))
 
     def create_dns(self, payload: dict[str, Any]) -> DNSConfig:
         return DNSConfig(
             name=payload["name"],
-            a_records=[self.create_a_record(r) for r in payload.get("a_records", ())],
+            a_records=list(map(self.create_a_record, payload.get("a_records", ()))),
         )
 
     def create_a_record(self, payload: dict[str, Any]) -> ARecord:
@@ -341,24 +369,24 @@ class EntityFactory:
 
     def create_disks(self, payload: dict[str, Any]) -> DisksConfig:
         return DisksConfig(
-            url=URL(payload["url"]),
+            url=_create_url(payload["url"]),
             storage_limit_per_user=payload["storage_limit_per_user"],
         )
 
     def create_buckets(self, payload: dict[str, Any]) -> BucketsConfig:
         return BucketsConfig(
-            url=URL(payload["url"]),
+            url=_create_url(payload["url"]),
             disable_creation=payload.get("disable_creation", False),
         )
 
     def create_ingress(self, payload: dict[str, Any]) -> IngressConfig:
         return IngressConfig(
-            acme_environment=ACMEEnvironment(payload["acme_environment"]),
+            acme_environment=_create_enum(ACMEEnvironment, payload["acme_environment"]),
             cors_origins=payload.get("cors_origins", ()),
         )
 
     def create_cloud_provider(self, payload: dict[str, Any]) -> CloudProvider:
-        cp_type = CloudProviderType(payload["type"].lower())
+        cp_type = _create_enum(CloudProviderType, payload["type"].lower())
         if cp_type == CloudProviderType.AWS:
             return self._create_aws_cloud_provider(payload)
         elif cp_type == CloudProviderType.GCP:
@@ -381,19 +409,21 @@ class EntityFactory:
                 access_key_id=credentials["access_key_id"],
                 secret_access_key=credentials["secret_access_key"],
             ),
-            node_pools=[self.create_node_pool(p) for p in payload["node_pools"]],
+            node_pools=list(map(self.create_node_pool, payload["node_pools"])),
             storage=self._create_aws_storage(payload["storage"]),
         )
 
     def create_node_pool(self, payload: dict[str, Any]) -> NodePool:
         price_value = payload.get("price")
-        price = Decimal(price_value) if price_value is not None else NodePool.price
+        price = (
+            _create_decimal(price_value) if price_value is not None else NodePool.price
+        )
         disk_size = payload.get("disk_size", 0)
         nvidia_gpu = payload.get("nvidia_gpu") or payload.get("gpu")
         nvidia_gpu_model = payload.get("nvidia_gpu_model") or payload.get("gpu_model")
         return NodePool(
             name=payload["name"],
-            role=NodeRole(payload["role"]),
+            role=_create_enum(NodeRole, payload["role"]),
             min_size=payload["min_size"],
             max_size=payload["max_size"],
             cpu=payload["cpu"],
@@ -422,33 +452,33 @@ class EntityFactory:
         )
 
     def _create_aws_storage(self, payload: dict[str, Any]) -> AWSStorage:
-        result = AWSStorage(
+        return AWSStorage(
             description=payload["description"],
-            performance_mode=EFSPerformanceMode(payload["performance_mode"]),
-            throughput_mode=EFSThroughputMode(payload["throughput_mode"]),
-            instances=[self._create_storage_instance(p) for p in payload["instances"]],
+            performance_mode=_create_enum(
+                EFSPerformanceMode, payload["performance_mode"]
+            ),
+            throughput_mode=_create_enum(EFSThroughputMode, payload["throughput_mode"]),
+            instances=list(map(self._create_storage_instance, payload["instances"])),
         )
-        return result
 
     def _create_google_cloud_provider(self, payload: dict[str, Any]) -> CloudProvider:
         return GoogleCloudProvider(
-            location_type=ClusterLocationType(payload["location_type"]),
+            location_type=_create_enum(ClusterLocationType, payload["location_type"]),
             region=payload["region"],
             zones=payload.get("zones", ()),
             project=payload["project"],
             credentials=payload["credentials"],
             tpu_enabled=payload.get("tpu_enabled", False),
-            node_pools=[self.create_node_pool(p) for p in payload["node_pools"]],
+            node_pools=list(map(self.create_node_pool, payload["node_pools"])),
             storage=self._create_google_storage(payload["storage"]),
         )
 
     def _create_google_storage(self, payload: dict[str, Any]) -> GoogleStorage:
-        result = GoogleStorage(
+        return GoogleStorage(
             description=payload["description"],
-            tier=GoogleFilestoreTier(payload["tier"]),
-            instances=[self._create_storage_instance(p) for p in payload["instances"]],
+            tier=_create_enum(GoogleFilestoreTier, payload["tier"]),
+            instances=list(map(self._create_storage_instance, payload["instances"])),
         )
-        return result
 
     def _create_azure_cloud_provider(self, payload: dict[str, Any]) -> CloudProvider:
         credentials = payload["credentials"]
@@ -462,50 +492,54 @@ class EntityFactory:
                 client_id=credentials["client_id"],
                 client_secret=credentials["client_secret"],
             ),
-            node_pools=[self.create_node_pool(p) for p in payload["node_pools"]],
+            node_pools=list(map(self.create_node_pool, payload["node_pools"])),
             storage=self._create_azure_storage(payload["storage"]),
         )
 
     def _create_azure_storage(self, payload: dict[str, Any]) -> AzureStorage:
-        result = AzureStorage(
+        return AzureStorage(
             description=payload["description"],
-            replication_type=AzureReplicationType(payload["replication_type"]),
-            tier=AzureStorageTier(payload["tier"]),
-            instances=[self._create_storage_instance(p) for p in payload["instances"]],
+            replication_type=_create_enum(
+                AzureReplicationType, payload["replication_type"]
+            ),
+            tier=_create_enum(AzureStorageTier, payload["tier"]),
+            instances=list(map(self._create_storage_instance, payload["instances"])),
         )
-        return result
 
     def _create_on_prem_cloud_provider(self, payload: dict[str, Any]) -> CloudProvider:
         credentials = None
-        if "credentials" in payload:
-            if "token" in payload["credentials"]:
+        credentials_payload = payload.get("credentials")
+        if credentials_payload is not None:
+            if "client_key_data" in credentials_payload:
                 credentials = KubernetesCredentials(
-                    ca_data=payload["credentials"]["ca_data"],
-                    token=payload["credentials"]["token"],
+                    ca_data=credentials_payload["ca_data"],
+                    client_key_data=credentials_payload["client_key_data"],
+                    client_cert_data=credentials_payload["client_cert_data"],
                 )
-            if "client_key_data" in payload["credentials"]:
+            elif "token" in credentials_payload:
                 credentials = KubernetesCredentials(
-                    ca_data=payload["credentials"]["ca_data"],
-                    client_key_data=payload["credentials"]["client_key_data"],
-                    client_cert_data=payload["credentials"]["client_cert_data"],
+                    ca_data=credentials_payload["ca_data"],
+                    token=credentials_payload["token"],
                 )
         return OnPremCloudProvider(
             kubernetes_url=(
-                URL(payload["kubernetes_url"]) if "kubernetes_url" in payload else None
+                _create_url(payload["kubernetes_url"])
+                if "kubernetes_url" in payload
+                else None
             ),
             credentials=credentials,
-            node_pools=[self.create_node_pool(p) for p in payload["node_pools"]],
+            node_pools=list(map(self.create_node_pool, payload["node_pools"])),
             storage=None,
         )
 
     def _create_vcd_cloud_provider(self, payload: dict[str, Any]) -> CloudProvider:
-        cp_type = CloudProviderType(payload["type"])
+        cp_type = _create_enum(CloudProviderType, payload["type"])
         credentials = payload["credentials"]
         organization = payload["organization"]
         virtual_data_center = payload["virtual_data_center"]
         return VCDCloudProvider(
             _type=cp_type,
-            url=URL(payload["url"]),
+            url=_create_url(payload["url"]),
             organization=organization,
             virtual_data_center=virtual_data_center,
             edge_name=payload["edge_name"],
@@ -517,18 +551,17 @@ class EntityFactory:
                 password=credentials["password"],
                 ssh_password=credentials.get("ssh_password"),
             ),
-            node_pools=[self.create_node_pool(p) for p in payload["node_pools"]],
+            node_pools=list(map(self.create_node_pool, payload["node_pools"])),
             storage=self._create_vcd_storage(payload["storage"]),
         )
 
     def _create_vcd_storage(self, payload: dict[str, Any]) -> VCDStorage:
-        result = VCDStorage(
+        return VCDStorage(
             description=payload["description"],
             profile_name=payload["profile_name"],
             size=payload["size"],
-            instances=[self._create_storage_instance(p) for p in payload["instances"]],
+            instances=list(map(self._create_storage_instance, payload["instances"])),
         )
-        return result
 
     def _create_storage_instance(self, payload: dict[str, Any]) -> StorageInstance:
         return StorageInstance(
@@ -566,7 +599,7 @@ class EntityFactory:
     @classmethod
     def _create_docker_registry(cls, payload: dict[str, Any]) -> DockerRegistryConfig:
         return DockerRegistryConfig(
-            url=URL(payload["url"]),
+            url=_create_url(payload["url"]),
             username=payload.get("username"),
             password=payload.get("password"),
             email=payload.get("email"),
@@ -575,7 +608,7 @@ class EntityFactory:
     @classmethod
     def _create_helm_registry(cls, payload: dict[str, Any]) -> HelmRegistryConfig:
         return HelmRegistryConfig(
-            url=URL(payload["url"]),
+            url=_create_url(payload["url"]),
             username=payload.get("username"),
             password=payload.get("password"),
         )
@@ -583,7 +616,7 @@ class EntityFactory:
     @classmethod
     def _create_neuro_auth(cls, payload: dict[str, Any]) -> NeuroAuthConfig:
         return NeuroAuthConfig(
-            url=URL(payload["url"]),
+            url=_create_url(payload["url"]),
             token=payload["token"],
         )
 
@@ -597,7 +630,7 @@ class EntityFactory:
     def _create_sentry_credentials(cls, payload: dict[str, Any]) -> SentryCredentials:
         return SentryCredentials(
             client_key_id=payload["client_key_id"],
-            public_dsn=URL(payload["public_dsn"]),
+            public_dsn=_create_url(payload["public_dsn"]),
             sample_rate=payload.get("sample_rate", SentryCredentials.sample_rate),
         )
 
@@ -612,8 +645,8 @@ class EntityFactory:
         return EMCECSCredentials(
             access_key_id=payload["access_key_id"],
             secret_access_key=payload["secret_access_key"],
-            s3_endpoint=URL(payload["s3_endpoint"]),
-            management_endpoint=URL(payload["management_endpoint"]),
+            s3_endpoint=_create_url(payload["s3_endpoint"]),
+            management_endpoint=_create_url(payload["management_endpoint"]),
             s3_assumable_role=payload["s3_assumable_role"],
         )
 
@@ -624,8 +657,8 @@ class EntityFactory:
         return OpenStackCredentials(
             account_id=payload["account_id"],
             password=payload["password"],
-            s3_endpoint=URL(payload["s3_endpoint"]),
-            endpoint=URL(payload["endpoint"]),
+            s3_endpoint=_create_url(payload["s3_endpoint"]),
+            endpoint=_create_url(payload["endpoint"]),
             region_name=payload["region_name"],
         )
 
@@ -653,7 +686,7 @@ class EntityFactory:
     ) -> EnergySchedule:
         return EnergySchedule(
             name=payload["name"],
-            price_per_kwh=Decimal(payload["price_per_kwh"]),
+            price_per_kwh=_create_decimal(payload["price_per_kwh"]),
             periods=[
                 self._create_energy_schedule_period(p, timezone=timezone)
                 for p in payload.get("periods", ())
@@ -737,31 +770,28 @@ class PayloadFactory:
 
     @classmethod
     def _create_helm_registry(cls, helm_registry: HelmRegistryConfig) -> dict[str, Any]:
-        result = {
+        return {
             "username": helm_registry.username,
             "password": helm_registry.password,
         }
-        return result
 
     @classmethod
     def _create_docker_registry(
         cls, docker_registry: DockerRegistryConfig
     ) -> dict[str, Any]:
-        result = {
+        return {
             "username": docker_registry.username,
             "password": docker_registry.password,
         }
-        return result
 
     @classmethod
     def _create_grafana_credentials(
         cls, grafana_credentials: GrafanaCredentials
     ) -> dict[str, str]:
-        result = {
+        return {
             "username": grafana_credentials.username,
             "password": grafana_credentials.password,
         }
-        return result
 
     @classmethod
     def _create_sentry_credentials(
@@ -777,37 +807,34 @@ class PayloadFactory:
     def _create_minio_credentials(
         cls, minio_credentials: MinioCredentials
     ) -> dict[str, str]:
-        result = {
+        return {
             "username": minio_credentials.username,
             "password": minio_credentials.password,
         }
-        return result
 
     @classmethod
     def _create_emc_ecs_credentials(
         cls, emc_ecs_credentials: EMCECSCredentials
     ) -> dict[str, str]:
-        result = {
+        return {
             "access_key_id": emc_ecs_credentials.access_key_id,
             "secret_access_key": emc_ecs_credentials.secret_access_key,
             "s3_endpoint": str(emc_ecs_credentials.s3_endpoint),
             "management_endpoint": str(emc_ecs_credentials.management_endpoint),
             "s3_assumable_role": emc_ecs_credentials.s3_assumable_role,
         }
-        return result
 
     @classmethod
     def _create_open_stack_credentials(
         cls, open_stack_credentials: OpenStackCredentials
     ) -> dict[str, str]:
-        result = {
+        return {
             "account_id": open_stack_credentials.account_id,
             "password": open_stack_credentials.password,
             "endpoint": str(open_stack_credentials.endpoint),
             "s3_endpoint": str(open_stack_credentials.s3_endpoint),
             "region_name": open_stack_credentials.region_name,
         }
-        return result
 
     @classmethod
     def create_storage(cls, storage: StorageConfig) -> dict[str, Any]:
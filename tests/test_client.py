@@ -0,0 +1,817 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import weakref
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+import aiohttp
+import pytest
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDictProxy
+
+import neuro_config_client.client as client_module
+from neuro_config_client import (
+    AddNodePoolRequest,
+    Cluster,
+    ClusterStatus,
+    ConfigClient,
+    ConfigClientBase,
+    NodeRole,
+    NotificationType,
+    PatchClusterRequest,
+)
+
+CREATED_AT = "2024-01-01T00:00:00"
+
+
+def _create_cluster_payload(name: str, status: str = "blank") -> dict[str, Any]:
+    return {"name": name, "status": status, "created_at": CREATED_AT}
+
+
+def _create_node_pool_payload(name: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "role": "platform_job",
+        "min_size": 0,
+        "max_size": 1,
+        "cpu": 1.0,
+        "available_cpu": 1.0,
+        "memory": 1024,
+        "available_memory": 1024,
+    }
+
+
+def _create_resource_preset_payload(name: str) -> dict[str, Any]:
+    return {"name": name, "credits_per_hour": "10", "cpu": 0.1, "memory": 100}
+
+
+class _RecordedRequest:
+    def __init__(self, request: web.Request, body: bytes) -> None:
+        self.method = request.method
+        self.path = request.path
+        self.query = dict(request.query)
+        self.headers: CIMultiDictProxy[str] = request.headers
+        self.body = body
+
+
+class ConfigServer:
+    def __init__(self) -> None:
+        self.clusters: dict[str, dict[str, Any]] = {}
+        self.node_pools: dict[str, list[dict[str, Any]]] = {}
+        self.resource_presets: dict[str, list[dict[str, Any]]] = {}
+        self.notifications: list[dict[str, Any]] = []
+        self.requests: list[_RecordedRequest] = []
+        # Older service versions respond with 400 to existing clusters
+        self.existing_cluster_status = 409
+        # When set, cluster GETs wait for it after reading the cluster state
+        self.get_cluster_released: asyncio.Event | None = None
+        # When set, notifications wait for it before being accepted
+        self.notifications_released: asyncio.Event | None = None
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._record])
+        app.router.add_get("/api/v1/clusters", self._list_clusters)
+        app.router.add_post("/api/v1/clusters", self._create_cluster)
+        app.router.add_get("/api/v1/clusters/{cluster}", self._get_cluster)
+        app.router.add_patch("/api/v1/clusters/{cluster}", self._patch_cluster)
+        app.router.add_delete("/api/v1/clusters/{cluster}", self._delete_cluster)
+        node_pools = "/api/v1/clusters/{cluster}/cloud_provider/node_pools"
+        app.router.add_get(node_pools, self._list_node_pools)
+        app.router.add_post(node_pools, self._add_node_pool)
+        app.router.add_delete(node_pools + "/{node_pool}", self._delete_node_pool)
+        resource_presets = "/api/v1/clusters/{cluster}/orchestrator/resource_presets"
+        app.router.add_get(resource_presets, self._list_resource_presets)
+        app.router.add_post(
+            "/api/v1/clusters/{cluster}/notifications", self._add_notification
+        )
+        return app
+
+    @web.middleware
+    async def _record(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.requests.append(_RecordedRequest(request, await request.read()))
+        return await handler(request)
+
+    def _get_cluster_payload(self, request: web.Request) -> dict[str, Any]:
+        name = request.match_info["cluster"]
+        if name not in self.clusters:
+            raise web.HTTPNotFound()
+        return self.clusters[name]
+
+    async def _list_clusters(self, request: web.Request) -> web.Response:
+        return web.json_response(list(self.clusters.values()))
+
+    async def _create_cluster(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        if not payload["name"].isalnum():
+            raise web.HTTPBadRequest(reason="Invalid cluster name")
+        if payload["name"] in self.clusters:
+            if self.existing_cluster_status == 400:
+                raise web.HTTPBadRequest(reason="Cluster already exists")
+            raise web.HTTPConflict()
+        cluster = _create_cluster_payload(payload["name"])
+        self.clusters[payload["name"]] = cluster
+        return web.json_response(cluster, status=201)
+
+    async def _get_cluster(self, request: web.Request) -> web.Response:
+        payload = dict(self._get_cluster_payload(request))
+        body = json.dumps(payload, sort_keys=True)
+        etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+        if self.get_cluster_released is not None:
+            await self.get_cluster_released.wait()
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(text=body, headers={"ETag": etag})
+
+    async def _patch_cluster(self, request: web.Request) -> web.Response:
+        cluster = self._get_cluster_payload(request)
+        cluster.update(await request.json())
+        return web.json_response(cluster)
+
+    async def _delete_cluster(self, request: web.Request) -> web.Response:
+        self._get_cluster_payload(request)
+        del self.clusters[request.match_info["cluster"]]
+        return web.Response(status=204)
+
+    async def _list_node_pools(self, request: web.Request) -> web.Response:
+        self._get_cluster_payload(request)
+        return web.json_response(self.node_pools.get(request.match_info["cluster"], []))
+
+    async def _add_node_pool(self, request: web.Request) -> web.Response:
+        cluster = self._get_cluster_payload(request)
+        payload = await request.json()
+        node_pools = self.node_pools.setdefault(request.match_info["cluster"], [])
+        node_pools.append(_create_node_pool_payload(payload["name"]))
+        return web.json_response(cluster, status=201)
+
+    async def _delete_node_pool(self, request: web.Request) -> web.Response:
+        cluster = self._get_cluster_payload(request)
+        node_pools = self.node_pools.get(request.match_info["cluster"], [])
+        name = request.match_info["node_pool"]
+        node_pools[:] = [np for np in node_pools if np["name"] != name]
+        return web.json_response(cluster)
+
+    async def _list_resource_presets(self, request: web.Request) -> web.Response:
+        self._get_cluster_payload(request)
+        return web.json_response(
+            self.resource_presets.get(request.match_info["cluster"], [])
+        )
+
+    async def _add_notification(self, request: web.Request) -> web.Response:
+        self._get_cluster_payload(request)
+        if self.notifications_released is not None:
+            await self.notifications_released.wait()
+        self.notifications.append(await request.json())
+        return web.Response(status=201)
+
+
+@pytest.fixture(params=["ijson", "orjson"])
+def json_parser(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(client_module, "ijson", None)
+    return request.param
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    # Replace the client's clock only, the event loop keeps using the real one
+    clock = _Clock()
+    monkeypatch.setattr(client_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def config_server() -> ConfigServer:
+    return ConfigServer()
+
+
+@pytest.fixture
+async def server(config_server: ConfigServer) -> AsyncIterator[TestServer]:
+    server = TestServer(config_server.create_app())
+    async with server:
+        yield server
+
+
+@pytest.fixture
+async def client(server: TestServer) -> AsyncIterator[ConfigClient]:
+    async with ConfigClient(server.make_url(""), token="default-token") as client:
+        yield client
+
+
+@pytest.fixture
+async def cached_client(server: TestServer) -> AsyncIterator[ConfigClient]:
+    async with ConfigClient(server.make_url(""), cache_ttl_s=60) as client:
+        yield client
+
+
+class TestConfigClient:
+    async def test_get_cluster(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        result = await client.get_cluster("c")
+
+        assert result == Cluster(
+            name="c", status=ClusterStatus.BLANK, created_at=mock.ANY
+        )
+
+    async def test_get_cluster__coalesced(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        config_server.get_cluster_released = asyncio.Event()
+
+        first = asyncio.create_task(client.get_cluster("c"))
+        second = asyncio.create_task(client.get_cluster("c"))
+        await asyncio.sleep(0.1)
+        config_server.get_cluster_released.set()
+
+        assert await first == await second
+        assert len(config_server.requests) == 1
+
+    async def test_get_cluster__coalesced_caller_cancelled(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        config_server.get_cluster_released = asyncio.Event()
+
+        first = asyncio.create_task(client.get_cluster("c"))
+        second = asyncio.create_task(client.get_cluster("c"))
+        await asyncio.sleep(0.1)
+        first.cancel()
+        await asyncio.sleep(0)
+        config_server.get_cluster_released.set()
+
+        result = await second
+        assert result.name == "c"
+        assert first.cancelled()
+        assert len(config_server.requests) == 1
+
+    async def test_get_cluster__not_found(self, client: ConfigClient) -> None:
+        with pytest.raises(ClientResponseError) as exc_info:
+            await client.get_cluster("c")
+
+        assert exc_info.value.status == 404
+
+    async def test_default_headers(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        await client.get_cluster("c")
+
+        headers = config_server.requests[0].headers
+        assert headers["Authorization"] == "Bearer default-token"
+        assert "Content-Type" not in headers
+
+    async def test_token_and_body_headers(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        await client.create_blank_cluster("c", "service-token", token="call-token")
+
+        request = config_server.requests[0]
+        assert request.headers["Authorization"] == "Bearer call-token"
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.body == b'{"name":"c","token":"service-token"}'
+
+    async def test_create_blank_cluster(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        result = await client.create_blank_cluster("c", "service-token")
+
+        assert result.name == "c"
+        assert list(config_server.clusters) == ["c"]
+
+    async def test_create_blank_cluster__existing(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        with pytest.raises(ClientResponseError) as exc_info:
+            await client.create_blank_cluster("c", "service-token")
+
+        assert exc_info.value.status == 409
+
+    @pytest.mark.parametrize("status", [400, 409])
+    async def test_create_blank_cluster__ignore_existing(
+        self, config_server: ConfigServer, client: ConfigClient, status: int
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        config_server.existing_cluster_status = status
+
+        result = await client.create_blank_cluster(
+            "c", "service-token", ignore_existing=True
+        )
+
+        assert result.name == "c"
+
+    async def test_create_blank_cluster__ignore_existing_invalid(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        with pytest.raises(ClientResponseError) as exc_info:
+            await client.create_blank_cluster(
+                "invalid name", "service-token", ignore_existing=True
+            )
+
+        assert exc_info.value.status == 400
+        assert len(config_server.requests) == 1
+
+    async def test_get_clusters_bulk(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        for name in ("a", "b", "c"):
+            config_server.clusters[name] = _create_cluster_payload(name)
+
+        result = await client.get_clusters_bulk(["c", "a", "b"], concurrency=2)
+
+        assert [c.name for c in result] == ["c", "a", "b"]
+
+    async def test_list_node_pools_bulk(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        for name in ("a", "b"):
+            config_server.clusters[name] = _create_cluster_payload(name)
+            config_server.node_pools[name] = [_create_node_pool_payload(name + "-np")]
+
+        result = await client.list_node_pools_bulk(["b", "a"])
+
+        assert [[np.name for np in nps] for nps in result] == [["b-np"], ["a-np"]]
+
+    async def test_list_resource_presets_bulk(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["a"] = _create_cluster_payload("a")
+        config_server.resource_presets["a"] = [
+            _create_resource_preset_payload("cpu-small")
+        ]
+
+        result = await client.list_resource_presets_bulk(["a"])
+
+        assert [[p.name for p in presets] for presets in result] == [["cpu-small"]]
+
+    @pytest.mark.usefixtures("json_parser")
+    async def test_iter_clusters(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        for name in ("a", "b"):
+            config_server.clusters[name] = _create_cluster_payload(name)
+
+        result = [c.name async for c in client.iter_clusters()]
+
+        assert result == ["a", "b"]
+
+    @pytest.mark.usefixtures("json_parser")
+    async def test_iter_node_pools(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["a"] = _create_cluster_payload("a")
+        config_server.node_pools["a"] = [
+            _create_node_pool_payload("np1"),
+            _create_node_pool_payload("np2"),
+        ]
+
+        result = [np.name async for np in client.iter_node_pools("a")]
+
+        assert result == ["np1", "np2"]
+
+    @pytest.mark.usefixtures("json_parser")
+    async def test_iter_resource_presets(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["a"] = _create_cluster_payload("a")
+        config_server.resource_presets["a"] = [
+            _create_resource_preset_payload("cpu-small")
+        ]
+
+        result = [p.name async for p in client.iter_resource_presets("a")]
+
+        assert result == ["cpu-small"]
+
+    async def test_add_node_pools(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["a"] = _create_cluster_payload("a")
+
+        result = await client.add_node_pools(
+            "a",
+            [
+                AddNodePoolRequest(name="np1", min_size=0, max_size=1),
+                AddNodePoolRequest(
+                    name="np2", min_size=0, max_size=1, role=NodeRole.PLATFORM
+                ),
+            ],
+        )
+
+        assert result.name == "a"
+        assert [np["name"] for np in config_server.node_pools["a"]] == ["np1", "np2"]
+        assert [r.query for r in config_server.requests] == [
+            {"start_deployment": "false"},
+            {"start_deployment": "true"},
+        ]
+
+    async def test_add_node_pools__empty(self, client: ConfigClient) -> None:
+        with pytest.raises(ValueError, match="At least one node pool"):
+            await client.add_node_pools("a", [])
+
+    async def test_delete_node_pool(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["a"] = _create_cluster_payload("a")
+        config_server.node_pools["a"] = [_create_node_pool_payload("np")]
+
+        result = await client.delete_node_pool("a", "np")
+
+        assert result is not None
+        assert result.name == "a"
+        assert config_server.node_pools["a"] == []
+
+    async def test_delete_node_pool__no_cluster(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["a"] = _create_cluster_payload("a")
+        config_server.node_pools["a"] = [_create_node_pool_payload("np")]
+
+        await client.delete_node_pool("a", "np", return_cluster=False)
+
+        assert config_server.node_pools["a"] == []
+
+    async def test_patch_and_weakref(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        # Instance attributes can be patched, and public methods use them
+        ref = weakref.ref(client)
+        payload = _create_cluster_payload("c")
+
+        with mock.patch.object(
+            client, "_json_request", return_value=payload
+        ) as request:
+            result = await client.get_cluster("c")
+
+        assert result.name == "c"
+        request.assert_awaited_once_with("GET", "clusters/c", token=None)
+        assert config_server.requests == []
+        assert ref() is client
+
+    async def test_reenter(
+        self, config_server: ConfigServer, server: TestServer
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        client = ConfigClient(server.make_url(""))
+
+        async with client:
+            async with client:
+                await client.get_cluster("c")
+            # the session is kept open until the outermost block exits
+            await client.get_cluster("c")
+
+        with pytest.raises(RuntimeError, match="outside of 'async with' block"):
+            await client.get_cluster("c")
+
+        async with client:
+            await client.get_cluster("c")
+
+        assert len(config_server.requests) == 3
+
+    async def test_notify(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        await client.notify("c", NotificationType.SUCCESS)
+        await client.notify("c", NotificationType.ERROR, "failed")
+
+        assert config_server.notifications == [
+            {"notification_type": "success"},
+            {"notification_type": "error", "message": "failed"},
+        ]
+        assert [r.headers["Content-Type"] for r in config_server.requests] == [
+            "application/json",
+            "application/json",
+        ]
+
+
+class TestConfigClientCache:
+    async def test_get_cluster__cached(
+        self, config_server: ConfigServer, cached_client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        first = await cached_client.get_cluster("c")
+        second = await cached_client.get_cluster("c")
+
+        assert first is second
+        assert len(config_server.requests) == 1
+
+    async def test_get_cluster__not_cached_by_default(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        await client.get_cluster("c")
+        await client.get_cluster("c")
+
+        assert len(config_server.requests) == 2
+
+    async def test_get_cluster__expired(
+        self, config_server: ConfigServer, cached_client: ConfigClient, clock: _Clock
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        await cached_client.get_cluster("c")
+        clock.now += 61
+        config_server.clusters["c"]["timezone"] = "Europe/Berlin"
+        result = await cached_client.get_cluster("c")
+
+        assert result.timezone == ZoneInfo("Europe/Berlin")
+        assert len(config_server.requests) == 2
+
+    async def test_get_cluster__revalidated(
+        self, config_server: ConfigServer, cached_client: ConfigClient, clock: _Clock
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        first = await cached_client.get_cluster("c")
+        clock.now += 61
+        second = await cached_client.get_cluster("c")
+        clock.now += 59
+        third = await cached_client.get_cluster("c")
+
+        assert first is second is third
+        assert len(config_server.requests) == 2
+        etag = config_server.requests[1].headers["If-None-Match"]
+        assert etag and etag.startswith('"')
+
+    async def test_get_cluster__expired_long_ago(
+        self, config_server: ConfigServer, cached_client: ConfigClient, clock: _Clock
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        await cached_client.get_cluster("c")
+        clock.now += 60 + client_module._CACHE_STALE_S
+        await cached_client.get_cluster("c")
+
+        assert len(config_server.requests) == 2
+        assert "If-None-Match" not in config_server.requests[1].headers
+
+    async def test_get_cluster__least_recently_used_evicted(
+        self,
+        config_server: ConfigServer,
+        cached_client: ConfigClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(client_module, "_CACHE_MAX_SIZE", 2)
+        for name in ("a", "b", "c"):
+            config_server.clusters[name] = _create_cluster_payload(name)
+
+        await cached_client.get_cluster("a")
+        await cached_client.get_cluster("b")
+        await cached_client.get_cluster("a")
+        await cached_client.get_cluster("c")
+        await cached_client.get_cluster("a")
+        await cached_client.get_cluster("b")
+
+        assert [r.path for r in config_server.requests] == [
+            "/api/v1/clusters/a",
+            "/api/v1/clusters/b",
+            "/api/v1/clusters/c",
+            "/api/v1/clusters/b",
+        ]
+
+    async def test_get_cluster__invalidated_by_mutation(
+        self, config_server: ConfigServer, cached_client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        await cached_client.get_cluster("c")
+
+        await cached_client.patch_cluster(
+            "c", PatchClusterRequest(timezone=ZoneInfo("Europe/Berlin"))
+        )
+        result = await cached_client.get_cluster("c")
+
+        assert result.timezone == ZoneInfo("Europe/Berlin")
+
+    async def test_get_cluster__in_flight_during_mutation(
+        self, config_server: ConfigServer, cached_client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        config_server.get_cluster_released = asyncio.Event()
+
+        # reads the cluster before the patch, but responds after it
+        stale = asyncio.create_task(cached_client.get_cluster("c"))
+        await asyncio.sleep(0.1)
+        await cached_client.patch_cluster(
+            "c", PatchClusterRequest(timezone=ZoneInfo("Europe/Berlin"))
+        )
+        fresh = asyncio.create_task(cached_client.get_cluster("c"))
+        await asyncio.sleep(0.1)
+        config_server.get_cluster_released.set()
+
+        assert (await stale).timezone == ZoneInfo("UTC")
+        assert (await fresh).timezone == ZoneInfo("Europe/Berlin")
+        assert (await cached_client.get_cluster("c")).timezone == ZoneInfo(
+            "Europe/Berlin"
+        )
+
+
+class _StubConfigClient(ConfigClientBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: list[tuple[str, str, bytes | None]] = []
+        self.cancelled = 0
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        token: str | None = None,
+        data: bytes | None = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        self.requests.append((method, path, data))
+        message = json.get("message") if json else None
+        if message == "fail":
+            raise ValueError(message)
+        if message == "stall" or path.endswith("/stall"):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        yield mock.Mock(spec=aiohttp.ClientResponse)
+
+
+class TestConfigClientBase:
+    async def test_get__caller_cancelled(self) -> None:
+        client = _StubConfigClient()
+
+        task = asyncio.create_task(client.get_cluster("stall"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert client.cancelled == 1
+        assert not client._inflight
+
+    async def test_aclose__cancels_inflight(self) -> None:
+        client = _StubConfigClient()
+
+        task = asyncio.create_task(client.get_cluster("stall"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await client.aclose()
+
+        assert client.cancelled == 1
+        assert not client._inflight
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+class TestConfigClientNotifications:
+    async def test_enqueue_notify(
+        self, config_server: ConfigServer, server: TestServer
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        async with ConfigClient(server.make_url("")) as client:
+            client.enqueue_notify("c", NotificationType.CLUSTER_UPDATING)
+            client.enqueue_notify("c", NotificationType.SUCCESS, "done")
+
+        # queued notifications are sent before the client is closed
+        assert config_server.notifications == [
+            {"notification_type": "cluster_updating"},
+            {"notification_type": "success", "message": "done"},
+        ]
+
+    async def test_enqueue_notify__failure_logged(
+        self,
+        config_server: ConfigServer,
+        client: ConfigClient,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        client.enqueue_notify("unknown", NotificationType.ERROR)
+        client.enqueue_notify("c", NotificationType.SUCCESS)
+        await client.aclose()
+
+        assert config_server.notifications == [{"notification_type": "success"}]
+        assert caplog.record_tuples == [
+            (
+                "neuro_config_client.client",
+                logging.WARNING,
+                "Failed to send error notification for cluster unknown",
+            )
+        ]
+
+    async def test_enqueue_notify__drain_timeout(
+        self,
+        config_server: ConfigServer,
+        server: TestServer,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+        config_server.notifications_released = asyncio.Event()
+
+        async with ConfigClient(
+            server.make_url(""), notify_drain_timeout_s=0.1
+        ) as client:
+            for _ in range(12):
+                client.enqueue_notify("c", NotificationType.SUCCESS)
+
+        assert config_server.notifications == []
+        assert caplog.record_tuples == [
+            (
+                "neuro_config_client.client",
+                logging.WARNING,
+                "Timed out sending notifications on close, 12 dropped",
+            )
+        ]
+
+    async def test_notify_many(
+        self, config_server: ConfigServer, client: ConfigClient
+    ) -> None:
+        config_server.clusters["c"] = _create_cluster_payload("c")
+
+        await client.notify_many(
+            "c",
+            [
+                (NotificationType.CLUSTER_UPDATING, None),
+                (NotificationType.CLUSTER_UPDATE_FAILED, "failed"),
+            ],
+            concurrency=1,
+        )
+
+        assert config_server.notifications == [
+            {"notification_type": "cluster_updating"},
+            {"notification_type": "cluster_update_failed", "message": "failed"},
+        ]
+
+    async def test_notify_many__failure_cancels_rest(self) -> None:
+        client = _StubConfigClient()
+
+        with pytest.raises(ValueError, match="fail"):
+            await client.notify_many(
+                "c",
+                [
+                    (NotificationType.SUCCESS, "stall"),
+                    (NotificationType.ERROR, "fail"),
+                ],
+            )
+
+        assert client.cancelled == 1
+
+    async def test_notify_many__failure_skips_pending(self) -> None:
+        client = _StubConfigClient()
+
+        with pytest.raises(ValueError, match="fail"):
+            await client.notify_many(
+                "c",
+                [
+                    (NotificationType.ERROR, "fail"),
+                    (NotificationType.SUCCESS, "stall"),
+                    (NotificationType.SUCCESS, None),
+                ],
+                concurrency=1,
+            )
+
+        assert client.cancelled == 1
+        assert len(client.requests) == 2
+
+    async def test_enqueue_notify__base_client(self) -> None:
+        client = _StubConfigClient()
+
+        client.enqueue_notify("c", NotificationType.SUCCESS)
+        await client.aclose()
+
+        assert client.requests == [
+            (
+                "POST",
+                "clusters/c/notifications",
+                b'{"notification_type":"success"}',
+            )
+        ]
+        assert client._notify_worker is None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import replace
-from datetime import datetime, time
+from datetime import time
 from decimal import Decimal
 from typing import Any
 from unittest import mock
@@ -23,6 +23,7 @@ from neuro_config_client.entities import (
     AzureStorage,
     AzureStorageTier,
     BucketsConfig,
+    CloudProvider,
     CloudProviderOptions,
     CloudProviderType,
     Cluster,
@@ -83,6 +84,8 @@ else:
     # why not backports.zoneinfo: https://github.com/pganssle/zoneinfo/issues/125
     from backports.zoneinfo._zoneinfo import ZoneInfo
 
+CREATED_AT = "2024-01-01T00:00:00"
+
 
 @pytest.fixture()
 def nvidia_small_gpu() -> str:
@@ -100,13 +103,13 @@ def intel_small_gpu() -> str:
 
 
 class TestEntityFactory:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def factory(self) -> EntityFactory:
         return EntityFactory()
 
     def test_create_empty_cluster(self, factory: EntityFactory) -> None:
         result = factory.create_cluster(
-            {"name": "default", "status": "blank", "created_at": str(datetime.now())}
+            {"name": "default", "status": "blank", "created_at": CREATED_AT}
         )
 
         assert result == Cluster(
@@ -153,7 +156,7 @@ class TestEntityFactory:
                 },
                 "cloud_provider": google_cloud_provider_response,
                 "credentials": credentials,
-                "created_at": str(datetime.now()),
+                "created_at": CREATED_AT,
             }
         )
 
@@ -179,7 +182,7 @@ class TestEntityFactory:
                 {
                     "name": "default",
                     "status": "blank",
-                    "created_at": str(datetime.now()),
+                    "created_at": CREATED_AT,
                     "timezone": "invalid",
                 }
             )
@@ -502,29 +505,36 @@ class TestEntityFactory:
 
         assert result == DNSConfig(name="neu.ro", a_records=[mock.ANY])
 
-    def test_create_a_record_with_ips(self, factory: EntityFactory) -> None:
-        result = factory.create_a_record(
-            {"name": "*.jobs-dev.neu.ro.", "ips": ["192.168.0.2"]}
-        )
-
-        assert result == ARecord(name="*.jobs-dev.neu.ro.", ips=["192.168.0.2"])
-
-    def test_create_a_record_dns_name(self, factory: EntityFactory) -> None:
-        result = factory.create_a_record(
-            {
-                "name": "*.jobs-dev.neu.ro.",
-                "dns_name": "load-balancer",
-                "zone_id": "/hostedzone/1",
-                "evaluate_target_health": True,
-            }
-        )
+    @pytest.mark.parametrize(
+        "payload, expected",
+        [
+            (
+                {"name": "*.jobs-dev.neu.ro.", "ips": ["192.168.0.2"]},
+                ARecord(name="*.jobs-dev.neu.ro.", ips=["192.168.0.2"]),
+            ),
+            (
+                {
+                    "name": "*.jobs-dev.neu.ro.",
+                    "dns_name": "load-balancer",
+                    "zone_id": "/hostedzone/1",
+                    "evaluate_target_health": True,
+                },
+                ARecord(
+                    name="*.jobs-dev.neu.ro.",
+                    dns_name="load-balancer",
+                    zone_id="/hostedzone/1",
+                    evaluate_target_health=True,
+                ),
+            ),
+        ],
+        ids=["ips", "dns_name"],
+    )
+    def test_create_a_record(
+        self, factory: EntityFactory, payload: dict[str, Any], expected: ARecord
+    ) -> None:
+        result = factory.create_a_record(payload)
 
-        assert result == ARecord(
-            name="*.jobs-dev.neu.ro.",
-            dns_name="load-balancer",
-            zone_id="/hostedzone/1",
-            evaluate_target_health=True,
-        )
+        assert result == expected
 
     def test_create_disks(self, factory: EntityFactory) -> None:
         result = factory.create_disks(
@@ -622,7 +632,7 @@ class TestEntityFactory:
             },
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def google_cloud_provider(self) -> GoogleCloudProvider:
         return GoogleCloudProvider(
             location_type=ClusterLocationType.ZONAL,
@@ -683,15 +693,6 @@ class TestEntityFactory:
             ),
         )
 
-    def test_create_cloud_provider_google(
-        self,
-        factory: EntityFactory,
-        google_cloud_provider: GoogleCloudProvider,
-        google_cloud_provider_response: dict[str, Any],
-    ) -> None:
-        result = factory.create_cloud_provider(google_cloud_provider_response)
-        assert result == google_cloud_provider
-
     @pytest.fixture
     def aws_cloud_provider_response(self) -> dict[str, Any]:
         return {
@@ -746,7 +747,7 @@ class TestEntityFactory:
             },
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aws_cloud_provider(self) -> AWSCloudProvider:
         return AWSCloudProvider(
             region="us-central-1",
@@ -798,15 +799,6 @@ class TestEntityFactory:
             ),
         )
 
-    def test_create_cloud_provider_aws(
-        self,
-        factory: EntityFactory,
-        aws_cloud_provider: AWSCloudProvider,
-        aws_cloud_provider_response: dict[str, Any],
-    ) -> None:
-        result = factory.create_cloud_provider(aws_cloud_provider_response)
-        assert result == aws_cloud_provider
-
     @pytest.fixture
     def azure_cloud_provider_response(self) -> dict[str, Any]:
         return {
@@ -862,7 +854,7 @@ class TestEntityFactory:
             },
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def azure_cloud_provider(self) -> AzureCloudProvider:
         return AzureCloudProvider(
             region="westus",
@@ -916,15 +908,6 @@ class TestEntityFactory:
             ),
         )
 
-    def test_create_cloud_provider_azure(
-        self,
-        factory: EntityFactory,
-        azure_cloud_provider: AzureCloudProvider,
-        azure_cloud_provider_response: dict[str, Any],
-    ) -> None:
-        result = factory.create_cloud_provider(azure_cloud_provider_response)
-        assert result == azure_cloud_provider
-
     @pytest.fixture
     def on_prem_cloud_provider_response(self) -> dict[str, Any]:
         return {
@@ -968,7 +951,7 @@ class TestEntityFactory:
             ],
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def on_prem_cloud_provider(self) -> OnPremCloudProvider:
         return OnPremCloudProvider(
             kubernetes_url=URL("localhost:8001"),
@@ -1012,15 +995,6 @@ class TestEntityFactory:
             storage=None,
         )
 
-    def test_create_cloud_provider_on_prem(
-        self,
-        factory: EntityFactory,
-        on_prem_cloud_provider: OnPremCloudProvider,
-        on_prem_cloud_provider_response: dict[str, Any],
-    ) -> None:
-        result = factory.create_cloud_provider(on_prem_cloud_provider_response)
-        assert result == on_prem_cloud_provider
-
     @pytest.fixture
     def vcd_cloud_provider_response(self) -> dict[str, Any]:
         return {
@@ -1082,7 +1056,7 @@ class TestEntityFactory:
             },
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def vcd_cloud_provider(self) -> VCDCloudProvider:
         return VCDCloudProvider(
             _type=CloudProviderType.VCD_MTS,
@@ -1141,14 +1115,28 @@ class TestEntityFactory:
             ),
         )
 
-    def test_create_cloud_provider_vcd(
+    @pytest.mark.parametrize("provider", ["google", "aws", "azure", "on_prem", "vcd"])
+    def test_create_cloud_provider(
+        self, request: pytest.FixtureRequest, factory: EntityFactory, provider: str
+    ) -> None:
+        response = request.getfixturevalue(f"{provider}_cloud_provider_response")
+        result = factory.create_cloud_provider(response)
+        assert result == request.getfixturevalue(f"{provider}_cloud_provider")
+
+    def test_create_cloud_provider__overridden(
         self,
-        factory: EntityFactory,
-        vcd_cloud_provider: VCDCloudProvider,
-        vcd_cloud_provider_response: dict[str, Any],
+        aws_cloud_provider_response: dict[str, Any],
+        aws_cloud_provider: AWSCloudProvider,
     ) -> None:
-        result = factory.create_cloud_provider(vcd_cloud_provider_response)
-        assert result == vcd_cloud_provider
+        class _EntityFactory(EntityFactory):
+            def _create_aws_cloud_provider(
+                self, payload: dict[str, Any]
+            ) -> CloudProvider:
+                return replace(aws_cloud_provider, region="overridden")
+
+        result = _EntityFactory().create_cloud_provider(aws_cloud_provider_response)
+
+        assert result == replace(aws_cloud_provider, region="overridden")
 
     @pytest.fixture
     def credentials(self) -> dict[str, Any]:
@@ -1299,7 +1287,7 @@ class TestEntityFactory:
             "extra_info": "will be ignored",
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def node_pool_options(self) -> NodePoolOptions:
         return NodePoolOptions(
             machine_type="Standard_ND24s",
@@ -1455,7 +1443,7 @@ class TestEntityFactory:
 
 
 class TestPayloadFactory:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def factory(self) -> PayloadFactory:
         return PayloadFactory()
 
@@ -1778,6 +1766,16 @@ class TestPayloadFactory:
             "software_versions": ["v1"],
         }
 
+    def test_create_tpu_resource__tuples(self, factory: PayloadFactory) -> None:
+        result = factory.create_tpu_resource(
+            TPUResource(
+                ipv4_cidr_block="10.0.0.0/8", types=("tpu",), software_versions=("v1",)
+            )
+        )
+
+        assert result["types"] == ["tpu"]
+        assert result["software_versions"] == ["v1"]
+
     def test_create_resource_preset(self, factory: PayloadFactory) -> None:
         result = factory.create_resource_preset(
             ResourcePreset(
@@ -1969,7 +1967,7 @@ class TestPayloadFactory:
 
         assert result == {"acme_environment": "production"}
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def credentials(self) -> CredentialsConfig:
         return CredentialsConfig(
             neuro=NeuroAuthConfig(
@@ -2079,7 +2077,7 @@ class TestPayloadFactory:
             "neuro_helm": {"username": "username", "password": "password"},
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def node_pool(self) -> NodePool:
         return NodePool(
             name="my-node-pool",